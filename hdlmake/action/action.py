@@ -33,7 +33,7 @@ from ..util import shell
 from ..sourcefiles import new_dep_solver as dep_solver
 from ..sourcefiles.srcfile import VHDLFile, VerilogFile, SVFile
 from ..sourcefiles.sourcefileset import SourceFileSet
-from ..module.module import Module, ModuleArgs
+from ..module.module import Module, ModuleArgs, clear_fetchto_cache
 
 class Action(object):
 
@@ -47,6 +47,7 @@ class Action(object):
         self.privative_fileset = SourceFileSet()
         self._deps_solved = False
         self.options = options
+        self._cwd = os.getcwd()
 
     def __contains(self, module):
         """Check if the pool contains the given module by checking the URL"""
@@ -72,8 +73,9 @@ class Action(object):
     def load_all_manifests(self):
         # Top level module.
         assert self.top_manifest is None
+        clear_fetchto_cache()
         self.top_manifest = self.new_module(parent=None,
-                                            url=os.getcwd(),
+                                            url=self._cwd,
                                             source=None,
                                             fetchto=".")
         # Parse the top manifest and all sub-modules.
@@ -117,23 +119,32 @@ class Action(object):
     def build_file_set(self):
         """Initialize the parseable and privative fileset contents"""
         total_files = self.build_complete_file_set()
+        if self.tool == None:
+            parseable_types = set([VHDLFile, VerilogFile, SVFile])
+            privative_types = None
+        else:
+            parseable_types = set(self.tool.get_parseable_files())
+            privative_types = set(self.tool.get_privative_files())
+        # The fileset each file goes to only depends on its type, so it is
+        # found once per class from its MRO and then looked up by type.
+        fileset_dict = {}
         for file_aux in total_files:
-            if self.tool == None:
-                if any(isinstance(file_aux, file_type)
-                       for file_type in [VHDLFile, VerilogFile, SVFile]):
-                    self.parseable_fileset.add(file_aux)
+            file_type = type(file_aux)
+            if file_type not in fileset_dict:
+                if not parseable_types.isdisjoint(file_type.__mro__):
+                    fileset_dict[file_type] = self.parseable_fileset
+                elif privative_types is None:
+                    fileset_dict[file_type] = self.privative_fileset
+                elif not privative_types.isdisjoint(file_type.__mro__):
+                    fileset_dict[file_type] = self.privative_fileset
                 else:
-                    self.privative_fileset.add(file_aux)
+                    fileset_dict[file_type] = None
+            fileset = fileset_dict[file_type]
+            if fileset is None:
+                logging.debug("File not supported by the tool: %s",
+                              file_aux.path)
             else:
-                if any(isinstance(file_aux, file_type)
-                       for file_type in self.tool.get_parseable_files()):
-                    self.parseable_fileset.add(file_aux)
-                elif any(isinstance(file_aux, file_type)
-                       for file_type in self.tool.get_privative_files()):
-                    self.privative_fileset.add(file_aux)
-                else:
-                    logging.debug("File not supported by the tool: %s",
-                                  file_aux.path)
+                fileset.add(file_aux)
         if len(self.privative_fileset) > 0:
             logging.info("Detected %d supported files that are not parseable",
                          len(self.privative_fileset))
@@ -24,9 +24,13 @@
 from __future__ import absolute_import
 from __future__ import print_function
 import logging
+import itertools
 import os
 import sys
 import os.path
+import subprocess
+from multiprocessing.pool import ThreadPool
+import six
 
 from ..sourcefiles import new_dep_solver as dep_solver
 from ..util import path as path_mod
@@ -34,6 +38,7 @@ from ..fetch.svn import Svn
 from ..fetch.git import Git, GitSM
 from ..fetch.local import Local
 from .action import Action
+from ..module.module import clear_fetchto_cache
 from ..util import shell
 
 
@@ -43,21 +48,21 @@ class Commands(Action):
 
     def __init__(self, *args):
         super(Commands, self).__init__(*args)
-        self.git_backend = Git()
-        self.gitsm_backend = GitSM()
+        jobs = getattr(self.options, 'submodule_jobs', None)
+        self.git_backend = Git(jobs=jobs)
+        self.gitsm_backend = GitSM(jobs=jobs)
         self.svn_backend = Svn()
         self.local_backend = Local()
 
     def _check_all_fetched(self):
         """Check if every module in the pool is fetched"""
 
-        if not len([m for m in self.manifests if not m.isfetched]) == 0:
+        unfetched = [m for m in self.manifests if not m.isfetched]
+        if unfetched:
             raise Exception(
                 "Fetching should be done before continuing.\n"
                 "The following modules remains unfetched:\n"
-                " {}".format(
-                    "\n ".join([str(m) for m in self.manifests
-                                if not m.isfetched])))
+                " {}".format("\n ".join(str(m) for m in unfetched)))
 
     def makefile(self):
         """Write the Makefile for the current design"""
@@ -77,58 +82,92 @@ class Commands(Action):
                                  filename=filename)
 
     def _fetch_all(self):
-        """Fetch all the modules declared in the design"""
+        """Fetch all the modules declared in the design.
+
+        The pool is walked level by level: every unfetched module in the
+        current frontier is fetched concurrently, then the manifests are
+        parsed (sequentially, the parser changes the working directory)
+        to discover the next frontier."""
 
         def _fetch_module(module):
-            """Fetch the given module from the remote origin"""
-            new_modules = []
+            """Fetch the given module from the remote origin, any exception
+            is returned so that it can be raised again in the main thread"""
             logging.debug("Fetching module: %s", str(module))
-            if module.source == 'svn':
-                result = self.svn_backend.fetch(module)
-            elif module.source == 'git':
-                result = self.git_backend.fetch(module)
-            else:
-                assert module.source == 'gitsm'
-                result = self.gitsm_backend.fetch(module)
-            if result is False:
-                raise Exception("Unable to fetch module {}".format(module.url))
-            module.parse_manifest()
-            for m in module.modules:
-                new_modules.extend(module.modules[m])
-            return new_modules
+            try:
+                if module.source == 'svn':
+                    result = self.svn_backend.fetch(module)
+                elif module.source == 'git':
+                    result = self.git_backend.fetch(module)
+                else:
+                    assert module.source == 'gitsm'
+                    result = self.gitsm_backend.fetch(module)
+            except BaseException:
+                # Also catch SystemExit (shell.run quits on error), the
+                # pool workers would die silently and never return
+                return None, sys.exc_info()
+            return result, None
 
         fetch_queue = self.manifests[:] # Need a copy of the list
-
-        while len(fetch_queue) > 0:
-            cur_mod = fetch_queue.pop()
-            new_modules = []
-            if cur_mod.isfetched:
-                new_modules = cur_mod.submodules()
-            else:
-                new_modules = _fetch_module(cur_mod)
-            for mod in new_modules:
-                if not mod.isfetched:
-                    logging.debug("Appended to fetch queue: "
-                                  + str(mod.url))
-                    fetch_queue.append(mod)
-                else:
-                    logging.debug("NOT appended to fetch queue: "
-                                  + str(mod.url))
+        fetch_pool = ThreadPool(getattr(self.options, 'threads', None))
+        try:
+            while len(fetch_queue) > 0:
+                frontier = fetch_queue
+                fetch_queue = []
+                new_modules = []
+                to_fetch = []
+                urls = set()
+                for mod in frontier:
+                    if mod.isfetched:
+                        new_modules.extend(mod.submodules())
+                    elif mod.url not in urls:
+                        # Do not fetch twice a module required several times
+                        urls.add(mod.url)
+                        to_fetch.append(mod)
+                # Wait for the whole frontier before parsing anything
+                results = fetch_pool.map(_fetch_module, to_fetch)
+                for mod, (result, exc_info) in zip(to_fetch, results):
+                    if exc_info is not None:
+                        six.reraise(*exc_info)
+                    if result is False:
+                        raise Exception(
+                            "Unable to fetch module {}".format(mod.url))
+                    clear_fetchto_cache(mod.fetchto())
+                # Only parse once all of the folders are read again, the
+                # manifests may require the modules fetched by others
+                for mod in to_fetch:
+                    mod.parse_manifest()
+                    new_modules.extend(
+                        itertools.chain.from_iterable(mod.modules.values()))
+                for mod in new_modules:
+                    if not mod.isfetched:
+                        logging.debug("Appended to fetch queue: "
+                                      + str(mod.url))
+                        fetch_queue.append(mod)
+                    else:
+                        logging.debug("NOT appended to fetch queue: "
+                                      + str(mod.url))
+        finally:
+            fetch_pool.close()
+            fetch_pool.join()
 
     def fetch(self):
         """Fetch the missing required modules from their remote origin"""
         logging.info("Fetching needed modules.")
-        for mod in self.manifests:
-            if mod.isfetched and not mod.manifest_dict == None:
-                if 'fetch_pre_cmd' in mod.manifest_dict:
-                    os.system(mod.manifest_dict.get("fetch_pre_cmd", ''))
+        self._run_fetch_cmds('fetch_pre_cmd')
         self._fetch_all()
-        for mod in self.manifests:
-            if mod.isfetched and not mod.manifest_dict == None:
-                if 'fetch_post_cmd' in mod.manifest_dict:
-                    os.system(mod.manifest_dict.get("fetch_post_cmd", ''))
+        # The pool must be walked again, as the post commands are also run
+        # for the modules that have just been fetched
+        self._run_fetch_cmds('fetch_post_cmd')
         logging.info("All modules fetched.")
 
+    def _run_fetch_cmds(self, cmd_name):
+        """Run the given fetch command of every fetched module defining it"""
+        for mod in self.manifests:
+            if mod.isfetched and mod.manifest_dict is not None:
+                command = mod.manifest_dict.get(cmd_name)
+                if command is not None:
+                    subprocess.call(command, shell=True)
+
     def clean(self):
         """Delete the local copy of the fetched modules"""
         logging.info("Removing fetched modules..")
@@ -167,40 +206,46 @@ class Commands(Action):
             delimiter = self.options.delimiter
         print(delimiter.join(files_str))
 
-    def _print_comment(self, message):
-        """Private method that prints a message to stdout if not terse"""
-        if not self.options.terse:
-            print(message)
-
-    def _print_file_list(self, file_list):
-        """Print file list to standard out"""
+    def _print_file_list(self, file_list, lines, comment):
+        """Add the file list to the lines to be printed to standard out"""
         if not len(file_list):
-            self._print_comment("# * This module has no files")
+            comment("# * This module has no files")
         else:
             for file_aux in file_list:
-                print("%s\t%s" % (
-                    path_mod.relpath(file_aux.path), "file"))
+                lines.append("%s\t%s" % (
+                    path_mod.relpath(file_aux.path, self._cwd), "file"))
 
     def list_modules(self):
         """List the modules that are contained by the pool"""
+        # The output is buffered and printed at once, the comment lines
+        # are simply dropped if terse
+        lines = []
+        terse = self.options.terse
+
+        def comment(message):
+            """Buffer a comment line, unless the output is terse"""
+            if not terse:
+                lines.append(message)
 
         for mod_aux in self.manifests:
             if not mod_aux.isfetched:
                 logging.warning("Module not fetched: %s", mod_aux.url)
-                self._print_comment("# MODULE UNFETCHED! -> %s" % mod_aux.url)
+                comment("# MODULE UNFETCHED! -> %s" % mod_aux.url)
             else:
-                self._print_comment("# MODULE START -> %s" % mod_aux.url)
+                comment("# MODULE START -> %s" % mod_aux.url)
                 if mod_aux.source in ['svn', 'git', 'gitsm']:
-                    self._print_comment("# * URL: " + mod_aux.url)
+                    comment("# * URL: " + mod_aux.url)
                 if (mod_aux.source
                         in ['svn', 'git', 'gitsm', 'local']
                         and mod_aux.parent):
-                    self._print_comment("# * The parent for this module is: %s"
-                                        % mod_aux.parent.url)
+                    comment("# * The parent for this module is: %s"
+                            % mod_aux.parent.url)
                 else:
-                    self._print_comment("# * This is the root module")
-                print("%s\t%s" % (mod_aux.path, mod_aux.source))
+                    comment("# * This is the root module")
+                lines.append("%s\t%s" % (mod_aux.path, mod_aux.source))
                 if self.options.withfiles:
-                    self._print_file_list(mod_aux.files)
-                self._print_comment("# MODULE END -> %s" % mod_aux.url)
-            self._print_comment("")
+                    self._print_file_list(mod_aux.files, lines, comment)
+                comment("# MODULE END -> %s" % mod_aux.url)
+            comment("")
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
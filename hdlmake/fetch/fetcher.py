@@ -21,6 +21,9 @@
 
 """Module providing the base class for the different code fetchers"""
 
+import os
+
+
 class Fetcher(object):
 
     """Base class for the code fetcher objects"""
@@ -28,3 +31,14 @@ class Fetcher(object):
     def fetch(self, module):
         """Stub method, this must be implemented by the code fetcher"""
         pass
+
+    @staticmethod
+    def make_fetchto(fetchto):
+        """Create the fetchto folder if it doesn't exist yet.  Sibling
+        modules are fetched in parallel, so another fetcher may win"""
+        if not os.path.isdir(fetchto):
+            try:
+                os.mkdir(fetchto)
+            except OSError:
+                if not os.path.isdir(fetchto):
+                    raise
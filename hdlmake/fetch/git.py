@@ -23,6 +23,8 @@
 
 from __future__ import absolute_import
 import os
+import re
+import threading
 from ..util import path as path_utils
 from ..util import shell
 from subprocess import PIPE, Popen
@@ -35,8 +37,47 @@ class Git(Fetcher):
     """This class provides the Git fetcher instances, that are
     used to fetch and handle Git repositories"""
 
-    def __init__(self):
+    def __init__(self, jobs=None):
         self.submodule = False
+        self.jobs = jobs
+        self._git_version = None
+        self._git_version_checked = False
+        self._git_version_lock = threading.Lock()
+
+    @staticmethod
+    def get_git_version():
+        """Get the version of the installed git as a tuple of integers,
+        or None if it can't be figured out"""
+        try:
+            command_out = Popen(["git", "--version"],
+                                stdout=PIPE, stderr=PIPE)
+        except OSError:
+            return None
+        version_str, _ = command_out.communicate()
+        if command_out.returncode != 0:
+            return None
+        match = re.search(r"(\d+)\.(\d+)", version_str.decode('utf-8'))
+        if match is None:
+            return None
+        return (int(match.group(1)), int(match.group(2)))
+
+    def git_version(self):
+        """Get the version of the installed git, git is only run the first
+        time (the modules may be fetched from several threads)"""
+        with self._git_version_lock:
+            if not self._git_version_checked:
+                self._git_version = self.get_git_version()
+                self._git_version_checked = True
+        return self._git_version
+
+    def submodule_update_command(self):
+        """Get the command cloning the submodules of a repository. Starting
+        from git 2.8, the submodules are cloned in parallel"""
+        version = self.git_version()
+        if self.jobs and version is not None and version >= (2, 8):
+            return ("git submodule update --init --recursive "
+                    "--jobs={}".format(self.jobs))
+        return "git submodule init && git submodule update --recursive"
 
     def get_submodule_commit(self, submodule_dir):
         """Get the commit for a repository if defined in Git submodules"""
@@ -53,8 +94,7 @@ class Git(Fetcher):
     def fetch(self, module):
         """Get the code from the remote Git repository"""
         fetchto = module.fetchto()
-        if not os.path.exists(fetchto):
-            os.mkdir(fetchto)
+        self.make_fetchto(fetchto)
         basename = path_utils.url_basename(module.url)
         mod_path = os.path.join(fetchto, basename)
         assert not module.isfetched
@@ -77,9 +117,8 @@ class Git(Fetcher):
             if os.system(cmd) != 0:
                 return False
         if self.submodule and not module.isfetched:
-            cmd = ("(cd {0} && git submodule init &&"
-                "git submodule update --recursive)")
-            cmd = cmd.format(mod_path)
+            cmd = "(cd {0} && {1})"
+            cmd = cmd.format(mod_path, self.submodule_update_command())
             if os.system(cmd) != 0:
                 return False
         module.isfetched = True
@@ -88,5 +127,6 @@ class Git(Fetcher):
 
 
 class GitSM(Git):
-    def __init__(self):
+    def __init__(self, jobs=None):
+        super(GitSM, self).__init__(jobs=jobs)
         self.submodule = True
@@ -39,8 +39,7 @@ class Svn(Fetcher):
     def fetch(self, module):
         """Get the code from the remote SVN repository"""
         fetchto = module.fetchto()
-        if not os.path.exists(fetchto):
-            os.mkdir(fetchto)
+        self.make_fetchto(fetchto)
         basename = path_utils.svn_basename(module.url)
         mod_path = os.path.join(fetchto, basename)
         cmd = "cd {0} && svn checkout {1} " + basename
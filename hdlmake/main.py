@@ -102,6 +102,19 @@ def _get_version_string(prog):
     return "{} {} [tool:{} cmd:{}]".format(prog, __version__, tool, cmd)
 
 
+def _positive_int(value):
+    """Convert an argument to an integer, rejecting values lower than 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            "invalid int value: '{}'".format(value))
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            "must be at least 1, got {}".format(number))
+    return number
+
+
 def _get_parser():
     """This is the parser function, where options and commands are defined.
     """
@@ -128,9 +141,17 @@ def _get_parser():
         "--windows", action='store_const', dest='make', const='windows',
         help="select a mingw/windows 'make' on windows platforms")
 
-    subparsers.add_parser(
+    fetch = subparsers.add_parser(
         "fetch",
         help="fetch and/or update all of the remote modules")
+    fetch.add_argument(
+        "-j", "--jobs", dest="threads", default=16, type=_positive_int,
+        help="number of modules to be fetched in parallel")
+    fetch.add_argument(
+        "--submodule-jobs", dest="submodule_jobs", default=4,
+        type=_positive_int,
+        help="number of submodules to be cloned in parallel by each "
+             "gitsm module (requires git 2.8)")
 
     subparsers.add_parser(
         "clean",
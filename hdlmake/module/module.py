@@ -39,6 +39,33 @@ from ..manifest_parser.manifestparser import ManifestParser
 import six
 
 
+# Entries of the fetchto folders, shared by all of the remote modules
+_FETCHTO_CACHE = {}
+
+
+def _fetchto_entries(fetchto):
+    """Get the names of the entries of the provided fetchto folder,
+    reading it from the disk only the first time it is requested"""
+    entries = _FETCHTO_CACHE.get(fetchto)
+    if entries is None:
+        if os.path.isdir(fetchto):
+            entries = frozenset(os.listdir(fetchto))
+        else:
+            entries = frozenset()
+        _FETCHTO_CACHE[fetchto] = entries
+    return entries
+
+
+def clear_fetchto_cache(fetchto=None):
+    """Forget the cached entries of a fetchto folder (or of all of them
+    if none is provided), this must be called once a module has been
+    fetched into it"""
+    if fetchto is None:
+        _FETCHTO_CACHE.clear()
+    else:
+        _FETCHTO_CACHE.pop(os.path.abspath(fetchto), None)
+
+
 class ModuleArgs(object):
     """This class is just a container for the main Module args"""
 
@@ -116,11 +143,13 @@ class Module(object):
             else:
                 self.url, self.branch, self.revision = path_mod.url_parse(url)
                 basename =  path_mod.url_basename(self.url)
-            self.path = path_mod.relpath(os.path.abspath(
-                os.path.join(fetchto, basename)))
+            abs_path = os.path.abspath(os.path.join(fetchto, basename))
+            self.path = path_mod.relpath(abs_path)
 
             # Check if the module dir exists and is not empty
-            if os.path.exists(self.path) and os.listdir(self.path):
+            entries = _fetchto_entries(os.path.dirname(abs_path))
+            if (os.path.basename(abs_path) in entries
+                    and os.path.isdir(abs_path) and os.listdir(abs_path)):
                 self.isfetched = True
                 logging.debug("Module %s (parent: %s) is fetched.",
                               url, self.parent.path)
@@ -160,7 +189,6 @@ class Module(object):
                     "Path specified in manifest {} doesn't exist: {}".format(
                     self.path, filepath))
 
-            filepath = path_mod.rel2abs(filepath, self.path)
             if os.path.isdir(filepath):
                 logging.warning(
                     "Path specified in manifest %s is a directory: %s",
@@ -170,9 +198,11 @@ class Module(object):
     def _make_list_of_paths(self, list_of_paths):
         """Get a list with only the valid absolute paths from the provided"""
         paths = []
+        # Use an absolute base so that rel2abs can be served from its cache
+        module_dir = os.path.abspath(self.path)
         for filepath in list_of_paths:
             if self._check_filepath(filepath):
-                paths.append(path_mod.rel2abs(filepath, self.path))
+                paths.append(path_mod.rel2abs(filepath, module_dir))
         return paths
 
     def _create_file_list_from_paths(self, paths):
@@ -121,9 +121,7 @@ class File(object):
 
     def extension(self):
         """Method that gets the extension for the file instance"""
-        tmp = self.path.rsplit('.')
-        ext = tmp[len(tmp) - 1]
-        return ext
+        return self.path.rpartition('.')[2]
 
 
 class DepFile(File):
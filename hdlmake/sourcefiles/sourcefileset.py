@@ -20,40 +20,131 @@
 
 from .dep_file import File
 import logging
+import six
 
 class SourceFileSet(set):
 
     """Class providing a extension of the 'set' object that includes
     methods that allow for an easier management of a collection of HDL
-    source files"""
+    source files.  The files are also kept in buckets indexed by each of
+    the classes they are an instance of, and the mutating methods of set
+    are overridden to keep the buckets in sync"""
 
     def __init__(self):
         super(SourceFileSet, self).__init__()
-        self = []
+        self._by_type = {}
+
+    def _add_file(self, file_aux):
+        """Add a single file to the set and to its type buckets"""
+        super(SourceFileSet, self).add(file_aux)
+        for klass in type(file_aux).__mro__:
+            self._by_type.setdefault(klass, set()).add(file_aux)
 
     def add(self, files):
         """Add a set of files to the source fileset instance"""
         if files is None:
             logging.debug("Got None as a file.\n Ommiting")
             return
-        if isinstance(files, (SourceFileSet, set)):
-            for file_aux in files:
-                super(SourceFileSet, self).add(file_aux)
+        if isinstance(files, File):
+            self._add_file(files)
+        elif isinstance(files, SourceFileSet):
+            # The type buckets of the other fileset can be merged directly
+            super(SourceFileSet, self).update(files)
+            for klass, bucket in files._by_type.items():
+                self._by_type.setdefault(klass, set()).update(bucket)
         else:
-            assert isinstance(files, File)
-            super(SourceFileSet, self).add(files)
+            assert not isinstance(files, six.string_types)
+            for file_aux in files:
+                self._add_file(file_aux)
+
+    def _remove_file(self, file_aux):
+        """Remove a single file from its type buckets"""
+        for klass in type(file_aux).__mro__:
+            self._by_type[klass].discard(file_aux)
+
+    def update(self, *others):
+        """Add the files of all of the provided collections"""
+        for files in others:
+            self.add(files)
+
+    def __ior__(self, other):
+        self.add(other)
+        return self
+
+    def remove(self, file_aux):
+        """Remove a file, raise a KeyError if it is not in the set"""
+        super(SourceFileSet, self).remove(file_aux)
+        self._remove_file(file_aux)
+
+    def discard(self, file_aux):
+        """Remove a file if it is in the set"""
+        if file_aux in self:
+            self.remove(file_aux)
+
+    def difference_update(self, *others):
+        """Remove the files of all of the provided collections"""
+        for files in others:
+            # Iterate over a copy, files may be the instance itself
+            for file_aux in list(files):
+                self.discard(file_aux)
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def pop(self):
+        """Remove and return an arbitrary file"""
+        file_aux = super(SourceFileSet, self).pop()
+        self._remove_file(file_aux)
+        return file_aux
+
+    def clear(self):
+        """Remove all of the files"""
+        super(SourceFileSet, self).clear()
+        self._by_type.clear()
+
+    def intersection_update(self, *others):
+        """Keep only the files found in all of the provided collections"""
+        kept = set(self).intersection(*others)
+        self.difference_update(set(self) - kept)
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def symmetric_difference_update(self, other):
+        """Keep the files found either in the instance or in the provided
+        collection, but not in both"""
+        other = set(other)
+        added = other - set(self)
+        self.difference_update(other)
+        self.add(added)
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
 
     def filter(self, filetype):
         """Method that filters and returns all of the HDL source files
         contained in the instance SourceFileSet matching the provided type"""
         out = SourceFileSet()
-        for file_aux in self:
-            if isinstance(file_aux, filetype):
-                out.add(file_aux)
+        bucket = self._by_type.get(filetype)
+        if not bucket:
+            return out
+        super(SourceFileSet, out).update(bucket)
+        # Copy the buckets, the files are all instances of filetype
+        for klass, files in self._by_type.items():
+            if issubclass(filetype, klass):
+                out._by_type[klass] = set(bucket)
+            elif issubclass(klass, filetype):
+                out._by_type[klass] = set(files)
+            else:
+                common = files & bucket
+                if common:
+                    out._by_type[klass] = common
         return out
 
     def sort(self):
         """Return a sorted list of the fileset.  This is useful to have always
         the same output"""
         return sorted(self, key=(lambda x: x.path))
-
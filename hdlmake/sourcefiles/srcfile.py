@@ -30,6 +30,9 @@ import logging
 
 from ..util import path as path_mod
 from .dep_file import DepFile, File
+from .vhdl_parser import VHDLParser
+from .vlog_parser import VerilogParser
+from .xci_parser import XCIParser
 import six
 
 
@@ -42,9 +45,11 @@ class SourceFile(DepFile):
         assert isinstance(path, six.string_types)
         self.library = library or "work"
         DepFile.__init__(self, path=path, module=module)
+        # Files are hashed on every set operation, compute it only once
+        self._hash = hash((self.path, self.library))
 
     def __hash__(self):
-        return hash(self.path + self.library)
+        return self._hash
 
 
 # SOURCE FILES
@@ -55,7 +60,6 @@ class VHDLFile(SourceFile):
 
     def __init__(self, path, module, library=None):
         SourceFile.__init__(self, path=path, module=module, library=library)
-        from .vhdl_parser import VHDLParser
         self.parser = VHDLParser(self)
 
 
@@ -65,7 +69,6 @@ class VerilogFile(SourceFile):
 
     def __init__(self, path, module, library=None, include_dirs=None):
         SourceFile.__init__(self, path=path, module=module, library=library)
-        from .vlog_parser import VerilogParser
         self.include_dirs = include_dirs[:] if include_dirs else []
         self.include_dirs.append(path_mod.relpath(self.dirname))
         self.parser = VerilogParser(self)
@@ -176,7 +179,6 @@ class XCIFile(SourceFile):
 
     def __init__(self, path, module, library=None):
         SourceFile.__init__(self, path=path, module=module, library=library)
-        from .xci_parser import XCIParser
         self.parser = XCIParser(self)
 
 XILINX_FILE_DICT = {
@@ -315,6 +317,51 @@ ALTERA_FILE_DICT = {
     'gdf': GDFFile}
 
 
+def _create_vhdl_file(path, module, library, include_dirs):
+    """Create a VHDL file, the include dirs are not used"""
+    return VHDLFile(path=path, module=module, library=library)
+
+
+def _verilog_file_factory(file_class):
+    """Get a function creating a Verilog/SystemVerilog file"""
+    def _create_file(path, module, library, include_dirs):
+        """Create a file of the enclosing class"""
+        return file_class(path=path, module=module, library=library,
+                          include_dirs=include_dirs)
+    return _create_file
+
+
+def _file_factory(file_class):
+    """Get a function creating a plain (not parsed) file"""
+    def _create_file(path, module, library, include_dirs):
+        """Create a file of the enclosing class, only the path and
+        module are used"""
+        return file_class(path=path, module=module)
+    return _create_file
+
+
+def _build_extension_dict():
+    """Build the dictionary mapping every supported extension to the
+    function creating the appropriated file.  Dictionaries are merged
+    from the lowest to the highest priority, e.g. 'vho' is a VHDL file"""
+    extension_dict = {}
+    for file_dict in [MICROSEMI_FILE_DICT, LATTICE_FILE_DICT,
+                      ALTERA_FILE_DICT, XILINX_FILE_DICT,
+                      {'wb': WBGenFile, 'tcl': TCLFile, 'sdc': SDCFile}]:
+        for extension, file_class in file_dict.items():
+            extension_dict[extension] = _file_factory(file_class)
+    for extension in ['sv', 'svh']:
+        extension_dict[extension] = _verilog_file_factory(SVFile)
+    for extension in ['v', 'vh', 'vo', 'vm']:
+        extension_dict[extension] = _verilog_file_factory(VerilogFile)
+    for extension in ['vhd', 'vhdl', 'vho']:
+        extension_dict[extension] = _create_vhdl_file
+    return extension_dict
+
+
+EXTENSION_DICT = _build_extension_dict()
+
+
 def create_source_file(path, module, library=None, include_dirs=None):
     """Function that analyzes the given arguments and returns a new HDL source
     file of the appropriated type"""
@@ -322,38 +369,11 @@ def create_source_file(path, module, library=None, include_dirs=None):
     assert os.path.isabs(path)
     _, extension = os.path.splitext(path)
     assert extension[0] == '.'
-    # Remove '.'
-    extension = extension[1:]
+    # Remove '.', the extensions are case insensitive
+    extension = extension[1:].lower()
     logging.debug("add file " + path)
 
-    if extension in ['vhd', 'vhdl', 'vho']:
-        new_file = VHDLFile(path=path,
-                            module=module,
-                            library=library)
-    elif extension in ['v', 'vh', 'vo', 'vm']:
-        new_file = VerilogFile(path=path,
-                               module=module,
-                               library=library,
-                               include_dirs=include_dirs)
-    elif extension == 'sv' or extension == 'svh':
-        new_file = SVFile(path=path,
-                          module=module,
-                          library=library,
-                          include_dirs=include_dirs)
-    elif extension == 'wb':
-        new_file = WBGenFile(path=path, module=module)
-    elif extension == 'tcl':
-        new_file = TCLFile(path=path, module=module)
-    elif extension == 'sdc':
-        new_file = SDCFile(path=path, module=module)
-    elif extension in XILINX_FILE_DICT:
-        new_file = XILINX_FILE_DICT[extension](path=path, module=module)
-    elif extension in ALTERA_FILE_DICT:
-        new_file = ALTERA_FILE_DICT[extension](path=path, module=module)
-    elif extension in LATTICE_FILE_DICT:
-        new_file = LATTICE_FILE_DICT[extension](path=path, module=module)
-    elif extension in MICROSEMI_FILE_DICT:
-        new_file = MICROSEMI_FILE_DICT[extension](path=path, module=module)
-    else:
+    create_file = EXTENSION_DICT.get(extension)
+    if create_file is None:
         raise Exception("Unknown extension '{}' for file {}".format(extension, path))
-    return new_file
+    return create_file(path, module, library, include_dirs)
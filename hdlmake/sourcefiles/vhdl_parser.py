@@ -29,6 +29,72 @@ import re
 
 from .new_dep_solver import DepParser
 
+# Comments and strings
+_COMMENT_PATTERN = re.compile('--.*?$|".?"', re.DOTALL | re.MULTILINE)
+
+# use packages
+_USE_PATTERN = re.compile(
+    r"^\s*use\s+(\w+)\s*\.\s*(\w+)",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE)
+
+# new entity
+_ENTITY_PATTERN = re.compile(
+    r"^\s*entity\s+(?P<name>\w+)\s+is\s+(?:port|generic|end)"
+    r".*?((?P=name)|entity)\s*;",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE)
+
+# new architecture
+_ARCHITECTURE_SPLIT_PATTERN = re.compile(
+    r"^\s*architecture\s+(?P<name>\w+)\s+of\s+(\w+)\s+is",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE)
+
+# new package
+_PACKAGE_PATTERN = re.compile(
+    r"^\s*package\s+(\w+)\s+is",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE)
+
+# component declaration
+_COMPONENT_PATTERN = re.compile(
+    r"^\s*component\s+(\w+).*?end\s+component.*?;",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE)
+
+# Signal declaration
+_SIGNAL_PATTERN = re.compile(
+    r"^\s*signal\s+(\w+).*?;",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE)
+
+# Constant declaration
+_CONSTANT_PATTERN = re.compile(
+    r"^\s*constant\s+(\w+).*?;",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE)
+
+# record declaration
+_RECORD_PATTERN = re.compile(
+    r"^\s*type\s+(\w+)\s+is\s+record.*?end\s+record.*?;",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE)
+
+# function declaration
+_FUNCTION_PATTERN = re.compile(
+    r"^\s*function\s+(?P<name>\w+)"
+    r".*?" # gobble arguments if any.
+    r"return\s+\w+"
+    r"(\s+is.*?end\s+function.*?)?" # gobble body if any.
+    r"\s*;",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE)
+
+# instantiations
+_INSTANCE_PATTERN = re.compile(
+    r"^\s*(?P<LABEL>\w+)\s*:"
+    r"\s*(?:entity\s+(?P<LIB>\w+)\.)?(?P<ENTITY>\w+)"
+    r"\s*(?:\(\s*(?P<ARCH>\w+)\s*\)\s*)?"
+    r"(?:port\s+map.*?|generic\s+map.*?)",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE)
+
+# libraries
+_LIBRARY_PATTERN = re.compile(
+    r"^\s*library\s*(\w+)\s*;",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE)
+
 
 class VHDLParser(DepParser):
 
@@ -52,14 +118,9 @@ class VHDLParser(DepParser):
                 "preprocess file %s (of length %d) in library %s",
                 vhdl_file.path, len(buf), vhdl_file.library)
             # Remove the comments and strings from the VHDL code
-            pattern = re.compile('--.*?$|".?"', re.DOTALL | re.MULTILINE)
-            return re.sub(pattern, "", buf)
+            return _COMMENT_PATTERN.sub("", buf)
 
         buf = _preprocess(dep_file)
-        # use packages
-        use_pattern = re.compile(
-            r"^\s*use\s+(\w+)\s*\.\s*(\w+)",
-            re.DOTALL | re.MULTILINE | re.IGNORECASE)
 
         def do_use(text):
             """Function to be applied by re.sub to every match of the
@@ -75,13 +136,8 @@ class VHDLParser(DepParser):
             dep_file.add_require(
                 DepRelation(pkg_name, lib_name, DepRelation.PACKAGE))
             return "<hdlmake use_pattern %s.%s>" % (lib_name, pkg_name)
-        buf = re.sub(use_pattern, do_use, buf)
-        
-        # new entity
-        entity_pattern = re.compile(
-            r"^\s*entity\s+(?P<name>\w+)\s+is\s+(?:port|generic|end)"
-            r".*?((?P=name)|entity)\s*;",
-            re.DOTALL | re.MULTILINE | re.IGNORECASE)
+        buf = _USE_PATTERN.sub(do_use, buf)
+
         def do_entity(text):
             """Function to be applied by re.sub to every match of the
             entity_pattern in the VHDL code -- group() returns positive matches
@@ -93,12 +149,7 @@ class VHDLParser(DepParser):
                 DepRelation(ent_name, dep_file.library, DepRelation.ENTITY))
             return "<hdlmake entity_pattern %s.%s>" % (dep_file.library, ent_name)
 
-        buf = re.sub(entity_pattern, do_entity, buf)
-
-        # new architecture
-        architecture_split_pattern = re.compile(
-            r"^\s*architecture\s+(?P<name>\w+)\s+of\s+(\w+)\s+is",
-            re.DOTALL | re.MULTILINE | re.IGNORECASE)
+        buf = _ENTITY_PATTERN.sub(do_entity, buf)
 
         def do_architecture(text):
             """Function to be applied by re.sub to every match of the
@@ -116,12 +167,7 @@ class VHDLParser(DepParser):
 
             return "<hdlmake architecture %s.%s>" % (dep_file.library,
                                                      text.group(2))
-        buf = re.sub(architecture_split_pattern, do_architecture, buf)
-
-        # new package
-        package_pattern = re.compile(
-            r"^\s*package\s+(\w+)\s+is",
-            re.DOTALL | re.MULTILINE | re.IGNORECASE)
+        buf = _ARCHITECTURE_SPLIT_PATTERN.sub(do_architecture, buf)
 
         def do_package(text):
             """Function to be applied by re.sub to every match of the
@@ -133,12 +179,7 @@ class VHDLParser(DepParser):
             dep_file.add_provide(
                 DepRelation(pkg_name, dep_file.library, DepRelation.PACKAGE))
             return "<hdlmake package %s.%s>" % (dep_file.library, pkg_name)
-        buf = re.sub(package_pattern, do_package, buf)
-
-        # component declaration
-        component_pattern = re.compile(
-            r"^\s*component\s+(\w+).*?end\s+component.*?;",
-            re.DOTALL | re.MULTILINE | re.IGNORECASE)
+        buf = _PACKAGE_PATTERN.sub(do_package, buf)
 
         def do_component(text):
             """Function to be applied by re.sub to every match of the
@@ -148,12 +189,7 @@ class VHDLParser(DepParser):
             logging.debug("found component declaration %s", text.group(1))
             return "<hdlmake component %s>" % text.group(1)
 
-        buf = re.sub(component_pattern, do_component, buf)
-
-        # Signal declaration
-        signal_pattern = re.compile(
-            r"^\s*signal\s+(\w+).*?;",
-            re.DOTALL | re.MULTILINE | re.IGNORECASE)
+        buf = _COMPONENT_PATTERN.sub(do_component, buf)
 
         def do_signal(text):
             """Function to be applied by re.sub to every match of the
@@ -163,12 +199,7 @@ class VHDLParser(DepParser):
             logging.debug("found signal declaration %s", text.group(1))
             return "<hdlmake signal %s>" % text.group(1)
 
-        buf = re.sub(signal_pattern, do_signal, buf)
-
-        # Constant declaration
-        constant_pattern = re.compile(
-            r"^\s*constant\s+(\w+).*?;",
-            re.DOTALL | re.MULTILINE | re.IGNORECASE)
+        buf = _SIGNAL_PATTERN.sub(do_signal, buf)
 
         def do_constant(text):
             """Function to be applied by re.sub to every match of the
@@ -178,13 +209,7 @@ class VHDLParser(DepParser):
             logging.debug("found constant declaration %s", text.group(1))
             return "<hdlmake constant %s>" % text.group(1)
 
-        buf = re.sub(constant_pattern, do_constant, buf)
-
-
-        # record declaration
-        record_pattern = re.compile(
-            r"^\s*type\s+(\w+)\s+is\s+record.*?end\s+record.*?;",
-            re.DOTALL | re.MULTILINE | re.IGNORECASE)
+        buf = _CONSTANT_PATTERN.sub(do_constant, buf)
 
         def do_record(text):
             """Function to be applied by re.sub to every match of the
@@ -194,16 +219,7 @@ class VHDLParser(DepParser):
             logging.debug("found record declaration %s", text.group(1))
             return "<hdlmake record %s>" % text.group(1)
 
-        buf = re.sub(record_pattern, do_record, buf)
-
-        # function declaration
-        function_pattern = re.compile(
-            r"^\s*function\s+(?P<name>\w+)"
-            r".*?" # gobble arguments if any.
-            r"return\s+\w+"
-            r"(\s+is.*?end\s+function.*?)?" # gobble body if any.
-            r"\s*;",
-            re.DOTALL | re.MULTILINE | re.IGNORECASE)
+        buf = _RECORD_PATTERN.sub(do_record, buf)
 
         def do_function(text):
             """Function to be applied by re.sub to every match of the
@@ -213,16 +229,9 @@ class VHDLParser(DepParser):
             logging.debug("found function declaration %s", text.group(1))
             return "<hdlmake function %s>" % text.group(1)
 
-        buf = re.sub(function_pattern, do_function, buf)
+        buf = _FUNCTION_PATTERN.sub(do_function, buf)
 
-        # instantiations
         libraries = set([dep_file.library])
-        instance_pattern = re.compile(
-            r"^\s*(?P<LABEL>\w+)\s*:"
-            r"\s*(?:entity\s+(?P<LIB>\w+)\.)?(?P<ENTITY>\w+)"
-            r"\s*(?:\(\s*(?P<ARCH>\w+)\s*\)\s*)?"
-            r"(?:port\s+map.*?|generic\s+map.*?)",
-            re.DOTALL | re.MULTILINE | re.IGNORECASE)
 
         def do_instance(text):
             """Function to be applied by re.sub to every match of the
@@ -237,12 +246,7 @@ class VHDLParser(DepParser):
             ent_name = text.group("ENTITY")
             dep_file.add_require(DepRelation(ent_name, lib_name, DepRelation.ENTITY))
             return "<hdlmake instance %s|%s|%s>" % (text.group("LABEL"), lib_name, ent_name)
-        buf = re.sub(instance_pattern, do_instance, buf)
-
-        # libraries
-        library_pattern = re.compile(
-            r"^\s*library\s*(\w+)\s*;",
-            re.DOTALL | re.MULTILINE | re.IGNORECASE)
+        buf = _INSTANCE_PATTERN.sub(do_instance, buf)
 
         def do_library(text):
             """Function to be applied by re.sub to every match of the
@@ -252,7 +256,7 @@ class VHDLParser(DepParser):
             logging.debug("use library %s", text.group(1))
             libraries.add(text.group(1))
             return "<hdlmake library %s>" % text.group(1)
-        buf = re.sub(library_pattern, do_library, buf)
+        buf = _LIBRARY_PATTERN.sub(do_library, buf)
         # logging.debug("\n" + buf) # print modified buffer.
 
         dep_file.is_parsed = True
@@ -34,11 +34,35 @@ import logging
 
 from .new_dep_solver import DepParser
 from .dep_file import DepRelation
-from .srcfile import create_source_file
 from collections import namedtuple
 import six
 
 
+# Comments and strings
+_COMMENT_PATTERN = re.compile(
+    r'//.*?$|/\*.*?\*/|"(?:\\.|[^\\"])*"',
+    re.DOTALL | re.MULTILINE)
+
+# Package imports and uses
+_IMPORT_PATTERN = re.compile(r"(\w+) *::(\w+|\\*)")
+
+# Packages
+_PACKAGE_PATTERN = re.compile(
+    r"package\s+(\w+)\s*(?:\(.*?\))?\s*(.+?)endpackage",
+    re.DOTALL | re.MULTILINE)
+
+# Modules, statements and instantiations
+_MODULE_PATTERN = re.compile(
+    r"(?:module|interface)\s+(\w+)\s*(?:#\s*\(.*?\)\s*)?(?:\(.*?\))?\s*;\s*(.+?)"
+    r"(?:endmodule|endinterface)",
+    re.DOTALL | re.MULTILINE)
+_INSTANTIATION_PATTERN = re.compile(
+    r"\s*\b(\w+)\s+(?:#\s*\(.*?\)\s*)?(\w+)\s*(?:\[.*?\]\s*)?\(.*?\)$",
+    re.DOTALL | re.MULTILINE)
+_STMT_PATTERN = re.compile(r'''(?:\s*(?:(?:\b(?:function|task)\b.*?\bend(?:function|task)\b)|(?:\bbegin(?:\s*:\s*\w+)?)|(?:\bend\b(?:\s*:\s*\w+)?)|(?:end(?:generate|case)\b)|(?:\b(?:case|if|for)\s*\(.*?\))|(?:\b(?:else|generate)\b)|\b(?:assign|localparam|wire|logic|reg)\b[^;]*?(?:=.*?)?;|\balways(?:_ff|_latch|_comb)?\b\s*(?:@\s*(?:\*|(?:\(.*?\))))?|;)\s*)+''',
+    re.MULTILINE | re.DOTALL)
+
+
 class VerilogPreprocessor(object):
 
     """This class provides the Verilog Preprocessor"""
@@ -91,10 +115,7 @@ class VerilogPreprocessor(object):
                     return ""
                 else:
                     return text
-            pattern = re.compile(
-                r'//.*?$|/\*.*?\*/|"(?:\\.|[^\\"])*"',
-                re.DOTALL | re.MULTILINE)
-            return re.sub(pattern, replacer, text)
+            return _COMMENT_PATTERN.sub(replacer, text)
 
         def _filter_protected_regions(text):
             '''Remove regions demarked by `pragma protect being_protected/end_protected'''
@@ -510,8 +531,6 @@ class VerilogParser(DepParser):
         #    logic var = my_other_module::MY_CONST;
         # and HdlMake will anyway create dependency marking my_other_module as
         # requested package
-        import_pattern = re.compile(r"(\w+) *::(\w+|\\*)")
-
         def do_imports(text):
             """Function to be applied by re.subn to every match of the
             import_pattern in the Verilog code -- group() returns positive
@@ -522,12 +541,8 @@ class VerilogParser(DepParser):
                           dep_file.path, dep_file.library, pkg_name)
             dep_file.add_require(
                 DepRelation(pkg_name, dep_file.library, DepRelation.PACKAGE))
-        import_pattern.subn(do_imports, buf)
+        _IMPORT_PATTERN.subn(do_imports, buf)
         # packages
-        m_inside_package = re.compile(
-            r"package\s+(\w+)\s*(?:\(.*?\))?\s*(.+?)endpackage",
-            re.DOTALL | re.MULTILINE)
-
         def do_package(text):
             """Function to be applied by re.subn to every match of the
             m_inside_pattern in the Verilog code -- group() returns positive
@@ -537,20 +552,9 @@ class VerilogParser(DepParser):
             logging.debug("found pacakge %s.%s", dep_file.library, pkg_name)
             dep_file.add_provide(
                 DepRelation(pkg_name, dep_file.library, DepRelation.PACKAGE))
-        m_inside_package.subn(do_package, buf)
+        _PACKAGE_PATTERN.subn(do_package, buf)
 
         # modules and instantiations
-        m_inside_module = re.compile(
-            r"(?:module|interface)\s+(\w+)\s*(?:#\s*\(.*?\)\s*)?(?:\(.*?\))?\s*;\s*(.+?)"
-            r"(?:endmodule|endinterface)",
-            re.DOTALL | re.MULTILINE)
-        m_instantiation = re.compile(
-            r"\s*\b(\w+)\s+(?:#\s*\(.*?\)\s*)?(\w+)\s*(?:\[.*?\]\s*)?\(.*?\)$",
-            re.DOTALL | re.MULTILINE)
-
-        m_stmt = re.compile(r'''(?:\s*(?:(?:\b(?:function|task)\b.*?\bend(?:function|task)\b)|(?:\bbegin(?:\s*:\s*\w+)?)|(?:\bend\b(?:\s*:\s*\w+)?)|(?:end(?:generate|case)\b)|(?:\b(?:case|if|for)\s*\(.*?\))|(?:\b(?:else|generate)\b)|\b(?:assign|localparam|wire|logic|reg)\b[^;]*?(?:=.*?)?;|\balways(?:_ff|_latch|_comb)?\b\s*(?:@\s*(?:\*|(?:\(.*?\))))?|;)\s*)+''',
-                            re.MULTILINE | re.DOTALL)
-
         def do_module(text):
             """Function to be applied by re.sub to every match of the
             m_inside_module in the Verilog code -- group() returns
@@ -574,10 +578,10 @@ class VerilogParser(DepParser):
                               dep_file.library, mod_name, text.group(2))
                 dep_file.add_require(
                     DepRelation(mod_name, dep_file.library, DepRelation.MODULE))
-            for stmt in [x for x in m_stmt.split(text.group(2)) if x and x[-1] == ")"]:
-                match = m_instantiation.match(stmt)
+            for stmt in [x for x in _STMT_PATTERN.split(text.group(2)) if x and x[-1] == ")"]:
+                match = _INSTANTIATION_PATTERN.match(stmt)
                 if match:
                     do_inst(match)
-        m_inside_module.subn(do_module, buf)
+        _MODULE_PATTERN.subn(do_module, buf)
 
         dep_file.is_parsed = True
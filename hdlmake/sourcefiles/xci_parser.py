@@ -21,14 +21,12 @@
 """This module provides a Xilinx XCI IP description parser for HDLMake"""
 
 from __future__ import absolute_import
-import re
 import logging
 
 from xml.etree import ElementTree as ET
 
 from .new_dep_solver import DepParser
 from .dep_file import DepRelation
-from ..sourcefiles.srcfile import create_source_file
 
 class XCIParser(DepParser):
     """Class providing the Xilinx XCI parser"""
@@ -41,17 +39,30 @@ class XCIParser(DepParser):
         assert not dep_file.is_parsed
         logging.debug("Parsing %s", dep_file.path)
 
-        with open(dep_file.path) as f:
-            # extract namespaces with a regex -- not really ideal, but without pulling in
-            # an external xml lib I can't think of a better way.
-            xmlnsre = re.compile(r'''\bxmlns:(\w+)\s*=\s*"(\w+://[^"]*)"''', re.MULTILINE)
-            xml = f.read()
-            nsmap = dict(xmlnsre.findall(xml))
-            value = ET.fromstring(xml).find('spirit:componentInstances/spirit:componentInstance/spirit:instanceName', nsmap)
-            if not value is None:
-                module_name = value.text
-                logging.debug("found module %s.%s", dep_file.library, module_name)
-                dep_file.add_provide(
-                    DepRelation(module_name, dep_file.library, DepRelation.MODULE))
+        # The prefix to namespace map is built from the 'start-ns' events,
+        # and the parsing stops at the first instance name.
+        nsmap = {}
+        instance_path = None
+        tag_path = []
+        for event, item in ET.iterparse(dep_file.path,
+                                        events=('start-ns', 'start', 'end')):
+            if event == 'start-ns':
+                prefix, uri = item
+                nsmap[prefix] = uri
+            elif event == 'start':
+                tag_path.append(item.tag)
+            else:
+                if instance_path is None and 'spirit' in nsmap:
+                    instance_path = ['{{{}}}{}'.format(nsmap['spirit'], tag)
+                        for tag in ('componentInstances', 'componentInstance',
+                                    'instanceName')]
+                if tag_path[1:] == instance_path:
+                    module_name = item.text
+                    logging.debug("found module %s.%s", dep_file.library, module_name)
+                    dep_file.add_provide(
+                        DepRelation(module_name, dep_file.library, DepRelation.MODULE))
+                    break
+                tag_path.pop()
+                item.clear()
 
         dep_file.is_parsed = True
@@ -87,27 +87,36 @@ endif""")
 
     def _makefile_syn_files(self):
         """Write the files TCL section of the Makefile"""
-        ret = []
         fileset_dict = {}
         sources_list = []
         fileset_dict.update(self.HDL_FILES)
         fileset_dict.update(self.SUPPORTED_FILES)
+        # Sort the files by type in a single pass over the fileset
+        files_dict = dict((filetype, []) for filetype in fileset_dict)
+        for file_aux in self.fileset:
+            file_path = None
+            for filetype in type(file_aux).__mro__:
+                if filetype not in files_dict:
+                    continue
+                if filetype == VerilogFile and isinstance(file_aux, SVFile):
+                    # Discard SVerilog files for verilog type.
+                    continue
+                if file_path is None:
+                    file_path = shell.tclpath(file_aux.rel_path())
+                files_dict[filetype].append(file_path)
+        has_sources = False
         for filetype in fileset_dict:
-            file_list = []
-            for file_aux in self.fileset:
-                if isinstance(file_aux, filetype):
-                    if filetype == VerilogFile and isinstance(file_aux, SVFile):
-                        # Discard SVerilog files for verilog type.
-                        continue
-                    file_list.append(shell.tclpath(file_aux.rel_path()))
-            if not file_list == []:
-                ret.append(
+            file_list = files_dict[filetype]
+            if file_list:
+                self.writeln(
                    'SOURCES_{0} := \\\n'
                    '{1}\n'.format(filetype.__name__,
                                ' \\\n'.join(file_list)))
+                has_sources = True
                 if not fileset_dict[filetype] is None:
                     sources_list.append(filetype)
-        self.writeln('\n'.join(ret))
+        if not has_sources:
+            self.writeln()
         self.writeln('files.tcl:')
         if "files" in self._tcl_controls:
             echo_command = '\t\t@echo {0} >> $@'
@@ -88,12 +88,40 @@ def is_abs_path(path):
     return os.path.isabs(path)
 
 
+# The paths computed from absolute paths only don't depend on the current
+# working directory, so they are memoized
+_RELPATH_ABS_CACHE = {}
+_JOIN_ABS_CACHE = {}
+
+
+def _relpath_abs(path1, path2):
+    """Cached relative path of two absolute paths"""
+    key = (path1, path2)
+    result = _RELPATH_ABS_CACHE.get(key)
+    if result is None:
+        result = os.path.relpath(path1, path2)
+        _RELPATH_ABS_CACHE[key] = result
+    return result
+
+
+def _join_abs(base, path):
+    """Cached normalized join of an absolute base and a relative path"""
+    key = (base, path)
+    result = _JOIN_ABS_CACHE.get(key)
+    if result is None:
+        result = os.path.normpath(os.path.join(base, path))
+        _JOIN_ABS_CACHE[key] = result
+    return result
+
+
 def relpath(path1, path2=None):
     """Return the relative path of one path with respect to the other"""
     if path2 is None:
         path2 = os.getcwd()
     if path1 == path2:
         return '.'
+    if os.path.isabs(path1) and os.path.isabs(path2):
+        return _relpath_abs(path1, path2)
     return os.path.relpath(path1, path2)
 
 
@@ -109,6 +137,8 @@ def rel2abs(path, base):
     """
     if os.path.isabs(path):
         return path
+    if os.path.isabs(base):
+        return _join_abs(base, path)
     retval = os.path.join(base, path)
     return os.path.abspath(retval)
 
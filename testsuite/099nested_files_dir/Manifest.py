@@ -0,0 +1,7 @@
+action = "simulation"
+
+sim_tool="modelsim"
+
+top_module = "gate"
+
+modules = { 'local': [ "sub"]}
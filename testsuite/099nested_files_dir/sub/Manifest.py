@@ -0,0 +1 @@
+files = [ "../../files" ]
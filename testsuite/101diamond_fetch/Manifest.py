@@ -0,0 +1,11 @@
+action = "simulation"
+
+sim_tool="modelsim"
+
+top_module = "gate"
+fetchto = "ipcores"
+
+files = [ "../files/gate.vhdl" ]
+# Both modules need module1 in ipcores_shared
+modules = { "local" : [ "local_mod" ],
+            "git" : "git@test.org:tester/module4.git" }
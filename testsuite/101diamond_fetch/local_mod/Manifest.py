@@ -0,0 +1,3 @@
+fetchto = "../ipcores_shared"
+
+modules = { "git" : "git@test.org:tester/module1.git" }
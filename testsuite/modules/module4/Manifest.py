@@ -0,0 +1,4 @@
+fetchto = "../../ipcores_shared"
+
+files = [ 'mod4.vhdl']
+modules = { "git" : "git@test.org:tester/module1.git" }
@@ -249,6 +249,18 @@ def test_gitsm_fetch():
         hdlmake.main.hdlmake(['clean'])
         shutil.rmtree('ipcores')
 
+def test_gitsm_fetch_jobs():
+    with Config(path="022gitsm_fetch") as _:
+        hdlmake.main.hdlmake(['fetch', '-j', '2', '--submodule-jobs', '1'])
+        shutil.rmtree('ipcores')
+
+def test_gitsm_fetch_old_git(monkeypatch):
+    # Submodules are not updated in parallel before git 2.8
+    monkeypatch.setenv('FAKE_GIT_VERSION', '2.7.4')
+    with Config(path="022gitsm_fetch") as _:
+        hdlmake.main.hdlmake(['fetch'])
+        shutil.rmtree('ipcores')
+
 def test_git_fetch_cmds():
     with Config(path="065fetch_pre_post") as _:
         hdlmake.main.hdlmake(['fetch'])
@@ -259,6 +271,24 @@ def test_sub_fetch():
         hdlmake.main.hdlmake(['fetch'])
         shutil.rmtree('ipcores')
 
+def test_sub_fetch_jobs():
+    for jobs in ['1', '4']:
+        with Config(path="095sub_fetch") as _:
+            hdlmake.main.hdlmake(['fetch', '-j', jobs])
+            shutil.rmtree('ipcores')
+
+def test_diamond_fetch():
+    # module1 is required by a local module and by a module of the same
+    # level, it must be fetched only once
+    with Config(path="101diamond_fetch") as _:
+        hdlmake.main.hdlmake(['fetch'])
+        shutil.rmtree('ipcores')
+        shutil.rmtree('ipcores_shared')
+
+def test_err_fetch_jobs():
+    with pytest.raises(SystemExit) as _:
+        run(['fetch', '-j', '0'], path="095sub_fetch")
+
 def test_err_fetch():
     with pytest.raises(SystemExit) as _:
         run([], path="065fetch_pre_post")
@@ -332,6 +362,11 @@ def test_files_dir():
     # as a file (will be replaced by all the files in the directory)
     run_compare(path="044files_dir")
 
+def test_nested_files_dir(caplog):
+    # A directory in the files of a nested module is also reported
+    run(['list-files'], path="099nested_files_dir")
+    assert "is a directory" in caplog.text
+
 def test_incl_makefile():
     run_compare(path="045incl_makefile")
 
@@ -355,6 +390,35 @@ def test_no_manifest():
     with pytest.raises(SystemExit) as _:
         run([], path="049err_no_manifest")
 
+def test_sourcefileset_buckets():
+    # More like a unittest: filter() must follow the set operations
+    from hdlmake.sourcefiles.dep_file import File
+    from hdlmake.sourcefiles.srcfile import TCLFile, UCFFile
+    from hdlmake.sourcefiles.sourcefileset import SourceFileSet
+    tcl, ucf, other = TCLFile("a.tcl"), UCFFile("a.ucf"), File("a.txt")
+    fileset = SourceFileSet()
+    fileset.update([tcl], [ucf])
+    fileset |= set([other])
+    assert fileset.filter(File) == set([tcl, ucf, other])
+    assert fileset.filter(File).filter(TCLFile) == set([tcl])
+    fileset.remove(tcl)
+    assert fileset.filter(TCLFile) == set()
+    fileset.discard(other)
+    assert fileset.filter(File) == set([ucf])
+    assert fileset.pop() is ucf
+    assert fileset.filter(UCFFile) == set()
+    fileset.add([tcl, ucf, other])
+    fileset &= set([tcl, ucf])
+    assert fileset.filter(File) == set([tcl, ucf])
+    fileset ^= set([ucf, other])
+    assert fileset.filter(File) == set([tcl, other])
+    assert fileset.filter(UCFFile) == set()
+    fileset -= fileset
+    assert fileset == set() and fileset.filter(File) == set()
+    fileset.add(tcl)
+    fileset.clear()
+    assert fileset.filter(TCLFile) == set()
+
 def test_configparser_bad_descr():
     # More like a unittest
     with pytest.raises(ValueError) as _:
@@ -522,6 +586,10 @@ def test_sys_package_097():
         hdlmake.main.hdlmake([])
         compare_makefile_xilinx()
 
+def test_upper_ext_100():
+    # The file extensions are case insensitive
+    run_compare(path="100upper_ext")
+
 @pytest.mark.xfail
 def test_xfail():
     """This is a self-consistency test: the test is known to fail"""